@@ -678,25 +678,33 @@ cdef class GSDFile:
 
         return index_entry != NULL
 
-    def read_chunk(self, frame, name):
-        """read_chunk(frame, name)
+    def read_chunk(self, frame, name, out=None):
+        """read_chunk(frame, name, out=None)
 
         Read a data chunk from the file and return it as a numpy array.
 
         Args:
             frame (int): Index of the frame to read
             name (str): Name of the chunk
+            out (`numpy.ndarray`): Array to store the data in. When ``None``,
+              allocate a new array.
 
         Returns:
             ``(N,M)`` or ``(N,)`` `numpy.ndarray` of ``type``: Data read from
             file. ``N``, ``M``, and ``type`` are determined by the chunk
             metadata. If the data is NxM in the file and M > 1, return a 2D
-            array. If the data is Nx1, return a 1D array.
+            array. If the data is Nx1, return a 1D array. When **out** is
+            given, return **out**.
+
+        Raises:
+            ValueError: When **out** is not a writable, C-contiguous array with
+              the type and shape of the chunk.
 
         .. tip::
             Each call invokes a disk read and allocation of a
             new numpy array for storage. To avoid overhead, call
-            :py:meth:`read_chunk()` on the same chunk only once.
+            :py:meth:`read_chunk()` on the same chunk only once, or pass
+            an existing array in **out** to reuse its storage.
 
         Example:
             .. ipython:: python
@@ -751,38 +759,49 @@ cdef class GSDFile:
 
         cdef void *data_ptr
         if gsd_type == libgsd.GSD_TYPE_UINT8:
-            data_array = numpy.empty(dtype=numpy.uint8,
-                                     shape=[index_entry.N, index_entry.M])
+            dtype = numpy.uint8
         elif gsd_type == libgsd.GSD_TYPE_UINT16:
-            data_array = numpy.empty(dtype=numpy.uint16,
-                                     shape=[index_entry.N, index_entry.M])
+            dtype = numpy.uint16
         elif gsd_type == libgsd.GSD_TYPE_UINT32:
-            data_array = numpy.empty(dtype=numpy.uint32,
-                                     shape=[index_entry.N, index_entry.M])
+            dtype = numpy.uint32
         elif gsd_type == libgsd.GSD_TYPE_UINT64:
-            data_array = numpy.empty(dtype=numpy.uint64,
-                                     shape=[index_entry.N, index_entry.M])
+            dtype = numpy.uint64
         elif gsd_type == libgsd.GSD_TYPE_INT8:
-            data_array = numpy.empty(dtype=numpy.int8,
-                                     shape=[index_entry.N, index_entry.M])
+            dtype = numpy.int8
         elif gsd_type == libgsd.GSD_TYPE_INT16:
-            data_array = numpy.empty(dtype=numpy.int16,
-                                     shape=[index_entry.N, index_entry.M])
+            dtype = numpy.int16
         elif gsd_type == libgsd.GSD_TYPE_INT32:
-            data_array = numpy.empty(dtype=numpy.int32,
-                                     shape=[index_entry.N, index_entry.M])
+            dtype = numpy.int32
         elif gsd_type == libgsd.GSD_TYPE_INT64:
-            data_array = numpy.empty(dtype=numpy.int64,
-                                     shape=[index_entry.N, index_entry.M])
+            dtype = numpy.int64
         elif gsd_type == libgsd.GSD_TYPE_FLOAT:
-            data_array = numpy.empty(dtype=numpy.float32,
-                                     shape=[index_entry.N, index_entry.M])
+            dtype = numpy.float32
         elif gsd_type == libgsd.GSD_TYPE_DOUBLE:
-            data_array = numpy.empty(dtype=numpy.float64,
-                                     shape=[index_entry.N, index_entry.M])
+            dtype = numpy.float64
         else:
             raise ValueError("invalid type for chunk: " + name)
 
+        if out is None:
+            data_array = numpy.empty(dtype=dtype,
+                                     shape=[index_entry.N, index_entry.M])
+        else:
+            if index_entry.M == 1:
+                shape = (index_entry.N,)
+            else:
+                shape = (index_entry.N, index_entry.M)
+
+            if (not isinstance(out, numpy.ndarray)
+                    or out.dtype != dtype
+                    or out.shape != shape
+                    or not out.flags['C_CONTIGUOUS']
+                    or not out.flags['WRITEABLE']):
+                raise ValueError("out must be a writable C-contiguous array "
+                                 "of " + numpy.dtype(dtype).name
+                                 + " with shape " + str(shape)
+                                 + " to read chunk: " + name)
+
+            data_array = out.reshape([index_entry.N, index_entry.M])
+
         logger.debug('read chunk: ' + self.name + ' - '
                      + str(frame) + ' - ' + name)
 
@@ -818,7 +837,9 @@ cdef class GSDFile:
 
             __raise_on_error(retval, self.name)
 
-        if index_entry.M == 1:
+        if out is not None:
+            return out
+        elif index_entry.M == 1:
             return data_array.reshape([index_entry.N])
         else:
             return data_array
@@ -18,7 +18,6 @@ See Also:
 """
 
 import numpy
-from collections import OrderedDict
 import logging
 import json
 import warnings
@@ -36,6 +35,23 @@ except ImportError:
 logger = logging.getLogger('gsd.hoomd')
 
 
+def _validate_array(data, dtype, shape):
+    """Convert data to a contiguous array with the given type and shape.
+
+    Return *data* unchanged when it is already such an array, which avoids the
+    conversion overhead for snapshots read from a file.
+    """
+    if not (isinstance(data, numpy.ndarray) and data.dtype == dtype
+            and data.flags.c_contiguous):
+        data = numpy.ascontiguousarray(data, dtype=dtype)
+
+    # data is contiguous here, so reshape returns a view and never copies
+    if data.shape != shape:
+        data = data.reshape(shape)
+
+    return data
+
+
 class ConfigurationData(object):
     """Store configuration data.
 
@@ -53,7 +69,7 @@ class ConfigurationData(object):
 
     """
 
-    _default_value = OrderedDict()
+    _default_value = {}
     _default_value['step'] = numpy.uint64(0)
     _default_value['dimensions'] = numpy.uint8(3)
     _default_value['box'] = numpy.array([1, 1, 1, 0, 0, 0], dtype=numpy.float32)
@@ -98,8 +114,7 @@ class ConfigurationData(object):
         logger.debug('Validating ConfigurationData')
 
         if self.box is not None:
-            self.box = numpy.ascontiguousarray(self.box, dtype=numpy.float32)
-            self.box = self.box.reshape([6])
+            self.box = _validate_array(self.box, numpy.float32, (6,))
 
 
 class ParticleData(object):
@@ -158,7 +173,7 @@ class ParticleData(object):
             visualizing particle types (:chunk:`particles/type_shapes`).
     """
 
-    _default_value = OrderedDict()
+    _default_value = {}
     _default_value['N'] = numpy.uint32(0)
     _default_value['types'] = ['A']
     _default_value['typeid'] = numpy.uint32(0)
@@ -176,6 +191,21 @@ class ParticleData(object):
     _default_value['image'] = numpy.array([0, 0, 0], dtype=numpy.int32)
     _default_value['type_shapes'] = [{}]
 
+    # Name, type, and shape (after the leading N) of each array attribute.
+    _array_schema = (
+        ('position', numpy.dtype(numpy.float32), (3,)),
+        ('orientation', numpy.dtype(numpy.float32), (4,)),
+        ('typeid', numpy.dtype(numpy.uint32), ()),
+        ('mass', numpy.dtype(numpy.float32), ()),
+        ('charge', numpy.dtype(numpy.float32), ()),
+        ('diameter', numpy.dtype(numpy.float32), ()),
+        ('body', numpy.dtype(numpy.int32), ()),
+        ('moment_inertia', numpy.dtype(numpy.float32), (3,)),
+        ('velocity', numpy.dtype(numpy.float32), (3,)),
+        ('angmom', numpy.dtype(numpy.float32), (4,)),
+        ('image', numpy.dtype(numpy.int32), (3,)),
+    )
+
     def __init__(self):
         self.N = 0
         self.position = None
@@ -206,47 +236,20 @@ class ParticleData(object):
         """
         logger.debug('Validating ParticleData')
 
-        if self.position is not None:
-            self.position = numpy.ascontiguousarray(self.position,
-                                                    dtype=numpy.float32)
-            self.position = self.position.reshape([self.N, 3])
-        if self.orientation is not None:
-            self.orientation = numpy.ascontiguousarray(self.orientation,
-                                                       dtype=numpy.float32)
-            self.orientation = self.orientation.reshape([self.N, 4])
-        if self.typeid is not None:
-            self.typeid = numpy.ascontiguousarray(self.typeid,
-                                                  dtype=numpy.uint32)
-            self.typeid = self.typeid.reshape([self.N])
-        if self.mass is not None:
-            self.mass = numpy.ascontiguousarray(self.mass, dtype=numpy.float32)
-            self.mass = self.mass.reshape([self.N])
-        if self.charge is not None:
-            self.charge = numpy.ascontiguousarray(self.charge,
-                                                  dtype=numpy.float32)
-            self.charge = self.charge.reshape([self.N])
-        if self.diameter is not None:
-            self.diameter = numpy.ascontiguousarray(self.diameter,
-                                                    dtype=numpy.float32)
-            self.diameter = self.diameter.reshape([self.N])
-        if self.body is not None:
-            self.body = numpy.ascontiguousarray(self.body, dtype=numpy.int32)
-            self.body = self.body.reshape([self.N])
-        if self.moment_inertia is not None:
-            self.moment_inertia = numpy.ascontiguousarray(self.moment_inertia,
-                                                          dtype=numpy.float32)
-            self.moment_inertia = self.moment_inertia.reshape([self.N, 3])
-        if self.velocity is not None:
-            self.velocity = numpy.ascontiguousarray(self.velocity,
-                                                    dtype=numpy.float32)
-            self.velocity = self.velocity.reshape([self.N, 3])
-        if self.angmom is not None:
-            self.angmom = numpy.ascontiguousarray(self.angmom,
-                                                  dtype=numpy.float32)
-            self.angmom = self.angmom.reshape([self.N, 4])
-        if self.image is not None:
-            self.image = numpy.ascontiguousarray(self.image, dtype=numpy.int32)
-            self.image = self.image.reshape([self.N, 3])
+        N = None
+        for name, dtype, shape in self._array_schema:
+            data = self.__dict__[name]
+            if data is not None:
+                if N is None:
+                    # compare shapes with a Python int, N read from a file is
+                    # a numpy scalar which is much slower to compare
+                    N = int(self.N)
+                self.__dict__[name] = _validate_array(data, dtype, (N,) + shape)
+
+
+# Names and default values of the ParticleData chunks in the order they are
+# written.
+_PARTICLE_FIELDS = tuple(ParticleData._default_value.items())
 
 
 class BondData(object):
@@ -308,7 +311,7 @@ class BondData(object):
         self.typeid = None
         self.group = None
 
-        self._default_value = OrderedDict()
+        self._default_value = {}
         self._default_value['N'] = numpy.uint32(0)
         self._default_value['types'] = []
         self._default_value['typeid'] = numpy.uint32(0)
@@ -329,12 +332,11 @@ class BondData(object):
         logger.debug('Validating BondData')
 
         if self.typeid is not None:
-            self.typeid = numpy.ascontiguousarray(self.typeid,
-                                                  dtype=numpy.uint32)
-            self.typeid = self.typeid.reshape([self.N])
+            self.typeid = _validate_array(self.typeid, numpy.uint32,
+                                          (int(self.N),))
         if self.group is not None:
-            self.group = numpy.ascontiguousarray(self.group, dtype=numpy.int32)
-            self.group = self.group.reshape([self.N, self.M])
+            self.group = _validate_array(self.group, numpy.int32,
+                                         (int(self.N), self.M))
 
 
 class ConstraintData(object):
@@ -367,7 +369,7 @@ class ConstraintData(object):
         self.value = None
         self.group = None
 
-        self._default_value = OrderedDict()
+        self._default_value = {}
         self._default_value['N'] = numpy.uint32(0)
         self._default_value['value'] = numpy.float32(0)
         self._default_value['group'] = numpy.array([0] * self.M,
@@ -388,12 +390,11 @@ class ConstraintData(object):
         logger.debug('Validating ConstraintData')
 
         if self.value is not None:
-            self.value = numpy.ascontiguousarray(self.value,
-                                                 dtype=numpy.float32)
-            self.value = self.value.reshape([self.N])
+            self.value = _validate_array(self.value, numpy.float32,
+                                         (int(self.N),))
         if self.group is not None:
-            self.group = numpy.ascontiguousarray(self.group, dtype=numpy.int32)
-            self.group = self.group.reshape([self.N, self.M])
+            self.group = _validate_array(self.group, numpy.int32,
+                                         (int(self.N), self.M))
 
 
 class Snapshot(object):
@@ -621,6 +622,109 @@ class Snapshot(object):
                 raise RuntimeError('Not a valid state: ' + k)
 
 
+# Number of rows compared at a time when testing if a chunk needs to be written.
+_COMPARE_BLOCK_SIZE = 65536
+
+# Number of default rows in the tile compared against multi-column chunks.
+_DEFAULT_TILE_SIZE = 256
+
+
+def _array_equal(a, b):
+    """Test if two chunk values are equal.
+
+    Compare same shape arrays one block of rows at a time, starting with the
+    first row. This returns at the first block that differs and avoids
+    allocating a temporary boolean array the size of the whole chunk.
+    """
+    if isinstance(a, numpy.ndarray) and isinstance(b, numpy.ndarray):
+        if a.shape != b.shape:
+            return False
+
+        if a.ndim >= 1 and a.shape[0] > 1:
+            if not numpy.array_equal(a[0], b[0]):
+                return False
+
+            for start in range(0, a.shape[0], _COMPARE_BLOCK_SIZE):
+                stop = start + _COMPARE_BLOCK_SIZE
+                if not (a[start:stop] == b[start:stop]).all():
+                    return False
+
+            return True
+
+    return numpy.array_equal(a, b)
+
+
+def _matches_default(data, default):
+    """Test if every element of a chunk value matches the default.
+
+    Compare per-particle (or per-bond) arrays against the default one block of
+    rows at a time, starting with the first row. This returns at the first
+    block that differs and avoids allocating a temporary boolean array the size
+    of the whole chunk.
+
+    Broadcasting a short default row such as ``[1, 0, 0, 0]`` over every row of
+    a block is slow, so compare multi-column chunks against a tile of
+    `_DEFAULT_TILE_SIZE` default rows instead. When every element of the
+    default row is the same, as in ``[0, 0, 0]``, compare the flattened chunk
+    against that single value.
+    """
+    if (isinstance(data, numpy.ndarray) and data.ndim >= 1 and data.shape[0] > 1
+            and numpy.shape(default) == data.shape[1:]):
+        if not numpy.array_equal(data[0], default):
+            return False
+
+        tile = None
+        row = numpy.asarray(default).tolist() if data.ndim == 2 else None
+        if row and row.count(row[0]) == len(row):
+            data = data.reshape(-1)
+            default = row[0]
+        elif data.ndim > 1 and data.shape[0] > _DEFAULT_TILE_SIZE:
+            tile = numpy.broadcast_to(default, (_DEFAULT_TILE_SIZE,)
+                                      + data.shape[1:]).copy()
+
+        for start in range(0, data.shape[0], _COMPARE_BLOCK_SIZE):
+            block = data[start:start + _COMPARE_BLOCK_SIZE]
+            if tile is not None:
+                # compare whole tiles first, then the remaining rows
+                n = block.shape[0] // _DEFAULT_TILE_SIZE * _DEFAULT_TILE_SIZE
+                tiles = block[:n].reshape((-1,) + tile.shape)
+                if not ((tiles == tile).all() and (block[n:] == default).all()):
+                    return False
+            elif not (block == default).all():
+                return False
+
+        return True
+
+    if numpy.size(default) == 0:
+        # an empty default (e.g. bond types) broadcasts against a single value
+        return numpy.size(data) == 0
+
+    return numpy.array_equiv(data, default)
+
+
+def _decode_strings(data):
+    """Decode a chunk of null padded UTF-8 strings to a list of `str`."""
+    rows = data.view(dtype=numpy.dtype((bytes, data.shape[1])))
+    rows = rows.reshape([data.shape[0]]).tolist()
+    return [row.decode('UTF-8') for row in rows]
+
+
+# Full names of the per frame chunks, indexed by path and then by name.
+_CHUNK_NAMES = {
+    path: {name: path + '/' + name for name in default_value}
+    for path, default_value in [
+        ('configuration', ConfigurationData._default_value),
+        ('particles', ParticleData._default_value),
+        ('bonds', BondData(2)._default_value),
+        ('angles', BondData(3)._default_value),
+        ('dihedrals', BondData(4)._default_value),
+        ('impropers', BondData(4)._default_value),
+        ('constraints', ConstraintData()._default_value),
+        ('pairs', BondData(2)._default_value),
+    ]
+}
+
+
 class _HOOMDTrajectoryIterable(object):
     """Iterable over a HOOMDTrajectory object."""
 
@@ -680,6 +784,7 @@ class HOOMDTrajectory(object):
 
         self._file = file
         self._initial_frame = None
+        self._default_cache = {}
 
         logger.info('opening HOOMDTrajectory: ' + str(self.file))
 
@@ -694,6 +799,12 @@ class HOOMDTrajectory(object):
             raise RuntimeError('Incompatible hoomd schema version '
                                + str(version) + ' in: ' + str(self.file))
 
+        # names of all chunks present in the file, only known to be complete
+        # when no chunks can be written
+        self._chunk_names = None
+        if self.file.mode == 'rb':
+            self._chunk_names = set(self.file.find_matching_chunk_names(''))
+
         logger.info('found ' + str(len(self)) + ' frames')
 
     @property
@@ -725,8 +836,9 @@ class HOOMDTrajectory(object):
 
         # want the initial frame specified as a reference to detect if chunks
         # need to be written
-        if self._initial_frame is None and len(self) > 0:
-            self._read_frame(0)
+        self._ensure_initial_frame()
+
+        write_chunk = self.file.write_chunk
 
         for path in [
                 'configuration',
@@ -739,35 +851,55 @@ class HOOMDTrajectory(object):
                 'pairs',
         ]:
             container = getattr(snapshot, path)
-            for name in container._default_value:
-                if self._should_write(path, name, snapshot):
-                    logger.debug('writing data chunk: ' + path + '/' + name)
-                    data = getattr(container, name)
-
-                    if name == 'N':
-                        data = numpy.array([data], dtype=numpy.uint32)
-                    if name == 'step':
-                        data = numpy.array([data], dtype=numpy.uint64)
-                    if name == 'dimensions':
-                        data = numpy.array([data], dtype=numpy.uint8)
-                    if name in ('types', 'type_shapes'):
-                        if name == 'type_shapes':
-                            data = [
-                                json.dumps(shape_dict) for shape_dict in data
-                            ]
-                        wid = max(len(w) for w in data) + 1
-                        b = numpy.array(data, dtype=numpy.dtype((bytes, wid)))
-                        data = b.view(dtype=numpy.int8).reshape(len(b), wid)
-
-                    self.file.write_chunk(path + '/' + name, data)
+            names = _CHUNK_NAMES[path]
+
+            # collect the non-None chunks first, then filter out those that
+            # need not be written
+            if path == 'particles':
+                values = container.__dict__
+                chunks = [(name, values[name], default)
+                          for name, default in _PARTICLE_FIELDS
+                          if values[name] is not None]
+            else:
+                chunks = [(name, getattr(container, name), default)
+                          for name, default in container._default_value.items()]
+                chunks = [(name, data, default)
+                          for name, data, default in chunks
+                          if data is not None]
+
+            chunks = [(name, data)
+                      for name, data, default in chunks
+                      if self._should_write(path, name, data, default)]
+
+            for name, data in chunks:
+                chunk_name = names[name]
+                logger.debug('writing data chunk: ' + chunk_name)
+
+                if name == 'N':
+                    data = numpy.array([data], dtype=numpy.uint32)
+                elif name == 'step':
+                    data = numpy.array([data], dtype=numpy.uint64)
+                elif name == 'dimensions':
+                    data = numpy.array([data], dtype=numpy.uint8)
+                elif name in ('types', 'type_shapes'):
+                    if name == 'type_shapes':
+                        data = [json.dumps(shape_dict) for shape_dict in data]
+                    # store as null padded rows of UTF-8 bytes
+                    encoded = [w.encode('UTF-8') for w in data]
+                    wid = max(len(w) for w in encoded) + 1
+                    b = b''.join(w.ljust(wid, b'\0') for w in encoded)
+                    data = numpy.frombuffer(b, dtype=numpy.int8)
+                    data = data.reshape(len(encoded), wid)
+
+                write_chunk(chunk_name, data)
 
         # write state data
         for state, data in snapshot.state.items():
-            self.file.write_chunk('state/' + state, data)
+            write_chunk('state/' + state, data)
 
         # write log data
         for log, data in snapshot.log.items():
-            self.file.write_chunk('log/' + log, data)
+            write_chunk('log/' + log, data)
 
         self.file.end_frame()
 
@@ -781,33 +913,28 @@ class HOOMDTrajectory(object):
         self.file.close()
         del self._initial_frame
 
-    def _should_write(self, path, name, snapshot):
+    def _should_write(self, path, name, data, default):
         """Test if we should write a given data chunk.
 
         Args:
             path (str): Path part of the data chunk.
             name (str): Name part of the data chunk.
-            snapshot (:py:class:`Snapshot`): Snapshot data is from.
+            data: Data to write (not ``None``).
+            default: Default value of the data chunk.
 
         Returns:
             False if the data matches that in the initial frame. False
             if the data matches all default values. True otherwise.
         """
-        container = getattr(snapshot, path)
-        data = getattr(container, name)
-
-        if data is None:
-            return False
-
         if self._initial_frame is not None:
             initial_container = getattr(self._initial_frame, path)
             initial_data = getattr(initial_container, name)
-            if numpy.array_equal(initial_data, data):
+            if _array_equal(initial_data, data):
                 logger.debug('skipping data chunk, matches frame 0: ' + path
                              + '/' + name)
                 return False
 
-        if numpy.array_equiv(data, container._default_value[name]):
+        if _matches_default(data, default):
             logger.debug('skipping data chunk, default value: ' + path + '/'
                          + name)
             return False
@@ -821,9 +948,13 @@ class HOOMDTrajectory(object):
             iterable: An iterable object the provides :py:class:`Snapshot`
                 instances. This could be another HOOMDTrajectory, a generator
                 that modifies snapshots, or a list of snapshots.
+
+        Append each item before requesting the next one from **iterable**, so
+        a generator may modify and yield the same snapshot every time.
         """
+        append = self.append
         for item in iterable:
-            self.append(item)
+            append(item)
 
     def read_frame(self, idx):
         """Read the frame at the given index from the file.
@@ -844,21 +975,69 @@ class HOOMDTrajectory(object):
         warnings.warn("Deprecated, trajectory[idx]", DeprecationWarning)
         return self._read_frame(idx)
 
-    def _read_frame(self, idx):
-        """Implements read_frame."""
+    def read_frame_into(self, idx, snapshot):
+        """Read the frame at the given index into an existing snapshot.
+
+        Args:
+            idx (int): Frame index to read. Negative values count from the
+                end of the trajectory.
+            snapshot (`Snapshot`): Snapshot to store the frame data in.
+
+        Returns:
+            **snapshot** with the frame data.
+
+        Read the frame in the same way as ``trajectory[idx]``. When a per
+        particle (or per bond) chunk is present in the frame, read it into
+        the matching array of **snapshot** if that array is writable and has
+        the type and shape of the chunk. Pass the same snapshot for every frame
+        in a loop to avoid allocating new arrays at each frame.
+
+        Warning:
+            The arrays in **snapshot** are overwritten in place. Copy any data
+            you need to keep before reading the next frame.
+        """
+        if idx < 0:
+            idx += len(self)
+        if idx >= len(self) or idx < 0:
+            raise IndexError()
+
+        if snapshot is self._initial_frame:
+            # keep the cached frame 0 intact, read a new copy to cache
+            self._initial_frame = None
+
+        # cache frame 0 first so that it never holds the arrays of snapshot
+        self._ensure_initial_frame()
+
+        frame = self._read_frame(idx, buffers=snapshot)
+        snapshot.__dict__.update(frame.__dict__)
+        return snapshot
+
+    def _ensure_initial_frame(self):
+        """Read frame 0 into the cache when it is not already cached."""
+        if self._initial_frame is None and self.file.nframes > 0:
+            self._read_frame(0)
+
+    def _read_frame(self, idx, buffers=None):
+        """Implements read_frame.
+
+        Read per particle (or per bond) chunks into the matching writable
+        arrays of the `Snapshot` **buffers** when possible.
+        """
         if idx >= len(self):
             raise IndexError
 
         logger.debug('reading frame ' + str(idx) + ' from: ' + str(self.file))
 
-        if self._initial_frame is None and idx != 0:
-            self._read_frame(0)
+        if idx != 0:
+            self._ensure_initial_frame()
+
+        # bind the chunk reader once, it is called for every chunk name
+        read_chunk = self._read_chunk
 
         snap = Snapshot()
         # read configuration first
-        if self.file.chunk_exists(frame=idx, name='configuration/step'):
-            step_arr = self.file.read_chunk(frame=idx,
-                                            name='configuration/step')
+        step_arr = read_chunk(idx, 'configuration/step')
+        if step_arr is not None:
             snap.configuration.step = step_arr[0]
         else:
             if self._initial_frame is not None:
@@ -867,9 +1046,8 @@ class HOOMDTrajectory(object):
                 snap.configuration.step = \
                     snap.configuration._default_value['step']
 
-        if self.file.chunk_exists(frame=idx, name='configuration/dimensions'):
-            dimensions_arr = self.file.read_chunk(
-                frame=idx, name='configuration/dimensions')
+        dimensions_arr = read_chunk(idx, 'configuration/dimensions')
+        if dimensions_arr is not None:
             snap.configuration.dimensions = dimensions_arr[0]
         else:
             if self._initial_frame is not None:
@@ -879,9 +1057,9 @@ class HOOMDTrajectory(object):
                 snap.configuration.dimensions = \
                     snap.configuration._default_value['dimensions']
 
-        if self.file.chunk_exists(frame=idx, name='configuration/box'):
-            snap.configuration.box = self.file.read_chunk(
-                frame=idx, name='configuration/box')
+        box = read_chunk(idx, 'configuration/box')
+        if box is not None:
+            snap.configuration.box = box
         else:
             if self._initial_frame is not None:
                 snap.configuration.box = self._initial_frame.configuration.box
@@ -900,12 +1078,15 @@ class HOOMDTrajectory(object):
                 'pairs',
         ]:
             container = getattr(snap, path)
+            names = _CHUNK_NAMES[path]
             if self._initial_frame is not None:
                 initial_frame_container = getattr(self._initial_frame, path)
+            if buffers is not None:
+                buffer_values = getattr(buffers, path).__dict__
 
             container.N = 0
-            if self.file.chunk_exists(frame=idx, name=path + '/N'):
-                N_arr = self.file.read_chunk(frame=idx, name=path + '/N')
+            N_arr = read_chunk(idx, names['N'])
+            if N_arr is not None:
                 container.N = N_arr[0]
             else:
                 if self._initial_frame is not None:
@@ -913,11 +1094,9 @@ class HOOMDTrajectory(object):
 
             # type names
             if 'types' in container._default_value:
-                if self.file.chunk_exists(frame=idx, name=path + '/types'):
-                    tmp = self.file.read_chunk(frame=idx, name=path + '/types')
-                    tmp = tmp.view(dtype=numpy.dtype((bytes, tmp.shape[1])))
-                    tmp = tmp.reshape([tmp.shape[0]])
-                    container.types = list(a.decode('UTF-8') for a in tmp)
+                tmp = read_chunk(idx, names['types'])
+                if tmp is not None:
+                    container.types = _decode_strings(tmp)
                 else:
                     if self._initial_frame is not None:
                         container.types = initial_frame_container.types
@@ -927,15 +1106,11 @@ class HOOMDTrajectory(object):
             # type shapes
             if ('type_shapes' in container._default_value
                     and path == 'particles'):
-                if self.file.chunk_exists(frame=idx,
-                                          name=path + '/type_shapes'):
-                    tmp = self.file.read_chunk(frame=idx,
-                                               name=path + '/type_shapes')
-                    tmp = tmp.view(dtype=numpy.dtype((bytes, tmp.shape[1])))
-                    tmp = tmp.reshape([tmp.shape[0]])
+                tmp = read_chunk(idx, names['type_shapes'])
+                if tmp is not None:
                     container.type_shapes = \
-                        list(json.loads(json_string.decode('UTF-8'))
-                             for json_string in tmp)
+                        list(json.loads(json_string)
+                             for json_string in _decode_strings(tmp))
                 else:
                     if self._initial_frame is not None:
                         container.type_shapes = \
@@ -944,14 +1119,22 @@ class HOOMDTrajectory(object):
                         container.type_shapes = \
                             container._default_value['type_shapes']
 
-            for name in container._default_value:
+            for name, default in container._default_value.items():
                 if name in ('N', 'types', 'type_shapes'):
                     continue
 
                 # per particle/bond quantities
-                if self.file.chunk_exists(frame=idx, name=path + '/' + name):
-                    container.__dict__[name] = self.file.read_chunk(
-                        frame=idx, name=path + '/' + name)
+                out = None
+                if buffers is not None:
+                    out = buffer_values.get(name)
+                    if not (isinstance(out, numpy.ndarray)
+                            and out.flags.writeable
+                            and out.shape[:1] == (container.N,)):
+                        out = None
+
+                data = read_chunk(idx, names[name], out)
+                if data is not None:
+                    container.__dict__[name] = data
                 else:
                     if (self._initial_frame is not None
                             and initial_frame_container.N == container.N):
@@ -959,27 +1142,33 @@ class HOOMDTrajectory(object):
                         container.__dict__[name] = \
                             initial_frame_container.__dict__[name]
                     else:
-                        # initialize from default value
-                        tmp = numpy.array([container._default_value[name]])
-                        s = list(tmp.shape)
-                        s[0] = container.N
-                        container.__dict__[name] = numpy.empty(shape=s,
-                                                               dtype=tmp.dtype)
-                        container.__dict__[name][:] = tmp
+                        # initialize from default value, sharing the same
+                        # read-only array between frames with the same N.
+                        # Keep only the most recent N so that the cache does
+                        # not grow when N changes from frame to frame.
+                        key = (path, name)
+                        data = self._default_cache.get(key)
+                        if data is None or data.shape[0] != container.N:
+                            shape = (container.N,) + numpy.shape(default)
+                            data = numpy.broadcast_to(default, shape).copy()
+                            data.flags.writeable = False
+                            self._default_cache[key] = data
+                        container.__dict__[name] = data
 
                     container.__dict__[name].flags.writeable = False
 
         # read state data
         for state in snap._valid_state:
-            if self.file.chunk_exists(frame=idx, name='state/' + state):
-                snap.state[state] = self.file.read_chunk(frame=idx,
-                                                         name='state/' + state)
+            data = read_chunk(idx, 'state/' + state)
+            if data is not None:
+                snap.state[state] = data
 
         # read log data
         logged_data_names = self.file.find_matching_chunk_names('log/')
         for log in logged_data_names:
-            if self.file.chunk_exists(frame=idx, name=log):
-                snap.log[log[4:]] = self.file.read_chunk(frame=idx, name=log)
+            data = read_chunk(idx, log)
+            if data is not None:
+                snap.log[log[4:]] = data
             else:
                 if self._initial_frame is not None:
                     snap.log[log[4:]] = self._initial_frame.log[log[4:]]
@@ -990,6 +1179,34 @@ class HOOMDTrajectory(object):
 
         return snap
 
+    def _read_chunk(self, idx, name, out=None):
+        """Read a chunk from the given frame.
+
+        Returns:
+            The chunk data, or ``None`` when the frame does not contain the
+            chunk.
+
+        Skip the index lookup for names that are in no frame of a read only
+        file. Store the data in **out** when it matches the chunk type and
+        shape.
+        """
+        chunk_names = self._chunk_names
+        if chunk_names is not None and name not in chunk_names:
+            return None
+
+        file = self._file
+        if file.chunk_exists(frame=idx, name=name):
+            if out is not None:
+                try:
+                    return file.read_chunk(frame=idx, name=name, out=out)
+                except ValueError:
+                    # out does not match the chunk, allocate a new array
+                    pass
+
+            return file.read_chunk(frame=idx, name=name)
+
+        return None
+
     def __getitem__(self, key):
         """Index trajectory frames.
 
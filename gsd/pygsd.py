@@ -281,15 +281,22 @@ class GSDFile(object):
         chunk = self._find_chunk(frame, name)
         return chunk is not None
 
-    def read_chunk(self, frame, name):
+    def read_chunk(self, frame, name, out=None):
         """Read a data chunk from the file and return it as a numpy array.
 
         Args:
             frame (int): Index of the frame to read
             name (str): Name of the chunk
+            out (`numpy.ndarray`): Array to store the data in. When ``None``,
+              return a new array.
 
         Returns:
-            `numpy.ndarray`: Data read from file.
+            `numpy.ndarray`: Data read from file. When **out** is given, return
+            **out**.
+
+        Raises:
+            ValueError: When **out** is not a writable, C-contiguous array with
+              the type and shape of the chunk.
 
         Examples:
             Read a 1D array::
@@ -335,7 +342,23 @@ class GSDFile(object):
             raise RuntimeError("Corrupt chunk: " + str(frame) + " / " + name
                                + " in file" + str(self.__file))
 
+        if out is not None:
+            dtype = gsd_type_mapping[chunk.type]
+            if chunk.M == 1:
+                shape = (chunk.N,)
+            else:
+                shape = (chunk.N, chunk.M)
+
+            if (not isinstance(out, numpy.ndarray) or out.dtype != dtype
+                    or out.shape != shape or not out.flags['C_CONTIGUOUS']
+                    or not out.flags['WRITEABLE']):
+                raise ValueError("out must be a writable C-contiguous array "
+                                 "of " + dtype.name + " with shape "
+                                 + str(shape) + " to read chunk: " + name)
+
         if (size == 0):
+            if out is not None:
+                return out
             return numpy.array([], dtype=gsd_type_mapping[chunk.type])
 
         self.__file.seek(chunk.location, 0)
@@ -347,7 +370,10 @@ class GSDFile(object):
         data_npy = numpy.frombuffer(data_raw,
                                     dtype=gsd_type_mapping[chunk.type])
 
-        if chunk.M == 1:
+        if out is not None:
+            out.reshape(-1)[:] = data_npy
+            return out
+        elif chunk.M == 1:
             return data_npy
         else:
             return data_npy.reshape([chunk.N, chunk.M])
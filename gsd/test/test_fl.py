@@ -253,6 +253,56 @@ def test_chunk_exists(tmp_path, open_mode):
             read_data = f.read_chunk(frame=1, name='test')  # noqa
 
 
+def test_read_chunk_out(tmp_path, open_mode):
+    """Test reading chunks into existing arrays."""
+    data1d = numpy.array([1, 2, 3, 4], dtype=numpy.float32)
+    data2d = numpy.array([[1, 2, 3], [4, 5, 6]], dtype=numpy.int32)
+    with gsd.fl.open(name=tmp_path / 'test_read_chunk_out.gsd',
+                     mode=open_mode.write,
+                     application='test_read_chunk_out',
+                     schema='none',
+                     schema_version=[1, 2]) as f:
+        f.write_chunk(name='data1d', data=data1d)
+        f.write_chunk(name='data2d', data=data2d)
+        f.end_frame()
+
+    def check(f):
+        out1d = numpy.zeros(4, dtype=numpy.float32)
+        assert f.read_chunk(frame=0, name='data1d', out=out1d) is out1d
+        numpy.testing.assert_array_equal(out1d, data1d)
+
+        out2d = numpy.zeros((2, 3), dtype=numpy.int32)
+        assert f.read_chunk(frame=0, name='data2d', out=out2d) is out2d
+        numpy.testing.assert_array_equal(out2d, data2d)
+
+        with pytest.raises(ValueError):
+            f.read_chunk(frame=0,
+                         name='data1d',
+                         out=numpy.zeros(4, dtype=numpy.float64))
+        with pytest.raises(ValueError):
+            f.read_chunk(frame=0, name='data2d', out=out2d.reshape(6))
+        with pytest.raises(ValueError):
+            f.read_chunk(frame=0,
+                         name='data2d',
+                         out=numpy.zeros((3, 2), dtype=numpy.int32).T)
+        out2d.flags.writeable = False
+        with pytest.raises(ValueError):
+            f.read_chunk(frame=0, name='data2d', out=out2d)
+
+    with gsd.fl.open(name=tmp_path / 'test_read_chunk_out.gsd',
+                     mode=open_mode.read,
+                     application='test_read_chunk_out',
+                     schema='none',
+                     schema_version=[1, 2]) as f:
+        check(f)
+
+    # test again with pygsd
+    with gsd.pygsd.GSDFile(
+            file=open(str(tmp_path
+                          / 'test_read_chunk_out.gsd'), mode='rb')) as f:
+        check(f)
+
+
 def test_readonly_errors(tmp_path, open_mode):
     """Test that read only files provide the appropriate errors."""
     data = numpy.array([1, 2, 3, 4, 5, 10012], dtype=numpy.int64)
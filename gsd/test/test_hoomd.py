@@ -54,6 +54,31 @@ def test_extend(tmp_path, open_mode):
         assert len(hf) == 5
 
 
+def test_extend_reuse(tmp_path, open_mode):
+    """Test extend with a generator that yields the same snapshot."""
+    snap = gsd.hoomd.Snapshot()
+    snap.particles.N = 2
+    snap.particles.position = numpy.zeros((2, 3), dtype=numpy.float32)
+
+    def frames():
+        for i in range(5):
+            snap.configuration.step = i + 1
+            snap.particles.position[:] = i
+            yield snap
+
+    with gsd.hoomd.open(name=tmp_path / "test_extend_reuse.gsd",
+                        mode=open_mode.write) as hf:
+        hf.extend(frames())
+
+    with gsd.hoomd.open(name=tmp_path / "test_extend_reuse.gsd",
+                        mode=open_mode.read) as hf:
+        assert len(hf) == 5
+        for i, s in enumerate(hf):
+            assert s.configuration.step == i + 1
+            numpy.testing.assert_array_equal(s.particles.position,
+                                             numpy.full((2, 3), i))
+
+
 def test_defaults(tmp_path, open_mode):
     """Test that the property defaults are properly set."""
     snap = gsd.hoomd.Snapshot()
@@ -510,6 +535,300 @@ def test_fallback2(tmp_path, open_mode):
         numpy.testing.assert_array_equal(s.particles.mass, snap0.particles.mass)
 
 
+def test_default_cache_varying_n(tmp_path, open_mode):
+    """Test that default values stay bounded when N changes every frame."""
+    with gsd.hoomd.open(name=tmp_path / "test_default_cache_varying_n.gsd",
+                        mode=open_mode.write) as hf:
+        for i in range(20):
+            snap = gsd.hoomd.Snapshot()
+            snap.configuration.step = i
+            snap.particles.N = 10 + i
+            snap.particles.position = numpy.ones((10 + i, 3))
+            hf.append(snap)
+
+    with gsd.hoomd.open(name=tmp_path / "test_default_cache_varying_n.gsd",
+                        mode=open_mode.read) as hf:
+        cache_sizes = []
+        for i, s in enumerate(hf):
+            assert s.particles.N == 10 + i
+            numpy.testing.assert_array_equal(s.particles.mass,
+                                             numpy.ones(10 + i))
+            cache_sizes.append(len(hf._default_cache))
+
+        # one cached array per defaulted field, independent of the frames
+        assert cache_sizes[-1] == cache_sizes[1]
+
+        # frames with the same N share the cached array
+        assert hf[-1].particles.mass is hf[-1].particles.mass
+
+
+def test_default_detection(tmp_path, open_mode):
+    """Test that chunks are skipped only when all values are defaults."""
+    N = 100000
+
+    snap = gsd.hoomd.Snapshot()
+    snap.particles.N = N
+    snap.particles.position = numpy.zeros((N, 3), dtype=numpy.float32)
+    snap.particles.velocity = numpy.zeros((N, 3), dtype=numpy.float32)
+    snap.particles.velocity[N - 1, 2] = 1
+    snap.particles.orientation = numpy.tile(
+        numpy.array([1, 0, 0, 0], dtype=numpy.float32), (N, 1))
+    snap.particles.angmom = numpy.zeros((N, 4), dtype=numpy.float32)
+    snap.particles.angmom[70000, 1] = 1
+    snap.particles.body = numpy.full(N, -1, dtype=numpy.int32)
+    snap.particles.mass = numpy.ones(N, dtype=numpy.float32)
+    snap.particles.mass[0] = 2
+
+    with gsd.hoomd.open(name=tmp_path / "test_default_detection.gsd",
+                        mode=open_mode.write) as hf:
+        hf.append(snap)
+
+    with gsd.hoomd.open(name=tmp_path / "test_default_detection.gsd",
+                        mode=open_mode.read) as hf:
+        assert not hf.file.chunk_exists(frame=0, name='particles/position')
+        assert not hf.file.chunk_exists(frame=0, name='particles/body')
+        assert not hf.file.chunk_exists(frame=0, name='particles/orientation')
+        assert hf.file.chunk_exists(frame=0, name='particles/angmom')
+        assert hf.file.chunk_exists(frame=0, name='particles/velocity')
+        assert hf.file.chunk_exists(frame=0, name='particles/mass')
+
+        s = hf[0]
+        numpy.testing.assert_array_equal(s.particles.velocity,
+                                         snap.particles.velocity)
+        numpy.testing.assert_array_equal(s.particles.mass, snap.particles.mass)
+
+
+def test_initial_frame_detection(tmp_path):
+    """Test that chunks are skipped only when they match frame 0."""
+    N = 100000
+    rng = numpy.random.default_rng(seed=1)
+    position = rng.random((N, 3), dtype=numpy.float32)
+
+    # frame 0 is only available for comparison in files opened for reading
+    with gsd.hoomd.open(name=tmp_path / "test_initial_frame_detection.gsd",
+                        mode='wb+') as hf:
+        for i in range(3):
+            snap = gsd.hoomd.Snapshot()
+            snap.configuration.step = i
+            snap.particles.N = N
+            snap.particles.position = position.copy()
+            if i == 1:
+                snap.particles.position[N - 1, 0] += 1
+            hf.append(snap)
+
+    with gsd.hoomd.open(name=tmp_path / "test_initial_frame_detection.gsd",
+                        mode='rb') as hf:
+        assert hf.file.chunk_exists(frame=0, name='particles/position')
+        assert hf.file.chunk_exists(frame=1, name='particles/position')
+        assert not hf.file.chunk_exists(frame=2, name='particles/position')
+
+        assert hf[1].particles.position[N - 1, 0] == position[N - 1, 0] + 1
+        numpy.testing.assert_array_equal(hf[2].particles.position, position)
+
+
+def test_validate_read_frame(tmp_path, open_mode):
+    """Test that validating a snapshot read from a file does not copy."""
+    snap = gsd.hoomd.Snapshot()
+    snap.configuration.box = [4, 5, 6, 0, 0, 0]
+    snap.particles.N = 4
+    snap.particles.position = numpy.ones((4, 3))
+    snap.particles.typeid = [0, 1, 0, 1]
+    snap.bonds.N = 2
+    snap.bonds.group = [[0, 1], [2, 3]]
+    snap.constraints.N = 1
+    snap.constraints.value = [1.5]
+    snap.constraints.group = [[0, 2]]
+
+    with gsd.hoomd.open(name=tmp_path / "test_validate_read_frame.gsd",
+                        mode=open_mode.write) as hf:
+        hf.append(snap)
+
+    with gsd.hoomd.open(name=tmp_path / "test_validate_read_frame.gsd",
+                        mode=open_mode.read) as hf:
+        s = hf[0]
+        arrays = [
+            s.configuration.box, s.particles.position, s.particles.typeid,
+            s.particles.mass, s.bonds.group, s.constraints.value,
+            s.constraints.group
+        ]
+        s.validate()
+
+        assert s.configuration.box is arrays[0]
+        assert s.particles.position is arrays[1]
+        assert s.particles.typeid is arrays[2]
+        assert s.particles.mass is arrays[3]
+        assert s.bonds.group is arrays[4]
+        assert s.constraints.value is arrays[5]
+        assert s.constraints.group is arrays[6]
+
+
+def test_validate_conversion():
+    """Test that validate converts flat and non-contiguous inputs."""
+    snap = gsd.hoomd.Snapshot()
+    snap.particles.N = 2
+    snap.particles.position = [1, 2, 3, 4, 5, 6]
+    velocity = numpy.arange(12, dtype=numpy.float32).reshape([4, 3])[::2]
+    snap.particles.velocity = velocity
+    image = numpy.zeros((2, 3), dtype=numpy.int32)
+    snap.particles.image = image
+    snap.validate()
+
+    assert snap.particles.position.dtype == numpy.float32
+    assert snap.particles.position.shape == (2, 3)
+    numpy.testing.assert_array_equal(snap.particles.position,
+                                     [[1, 2, 3], [4, 5, 6]])
+    assert snap.particles.velocity.flags.c_contiguous
+    numpy.testing.assert_array_equal(snap.particles.velocity, velocity)
+    assert snap.particles.image is image
+
+
+def test_validate_particles_n_none(tmp_path, open_mode):
+    """Test appending a snapshot with particles.N unset and no arrays."""
+    snap = gsd.hoomd.Snapshot()
+    snap.particles.N = 2
+    snap.particles.mass = [2, 3]
+
+    with gsd.hoomd.open(name=tmp_path / "test_validate_particles_n_none.gsd",
+                        mode=open_mode.write) as hf:
+        hf.append(snap)
+        snap = gsd.hoomd.Snapshot()
+        snap.configuration.step = 1
+        snap.particles.N = None
+        hf.append(snap)
+
+    with gsd.hoomd.open(name=tmp_path / "test_validate_particles_n_none.gsd",
+                        mode=open_mode.read) as hf:
+        assert len(hf) == 2
+        assert hf[1].particles.N == 2
+        numpy.testing.assert_array_equal(hf[1].particles.mass, [2, 3])
+
+
+def test_modify_read_frame(tmp_path, open_mode):
+    """Test that modified snapshots read from a file are validated."""
+    snap = gsd.hoomd.Snapshot()
+    snap.particles.N = 2
+    snap.particles.position = [[1, 2, 3], [4, 5, 6]]
+
+    with gsd.hoomd.open(name=tmp_path / "test_modify_read_frame.gsd",
+                        mode=open_mode.write) as hf:
+        hf.append(snap)
+
+    with gsd.hoomd.open(name=tmp_path / "test_modify_read_frame.gsd",
+                        mode=open_mode.read) as hf:
+        s = hf[0]
+
+    s.particles.position = [[7, 8, 9], [10, 11, 12]]
+    s.particles.typeid = (1, 0)
+    s.state['hpmc/sphere/radius'] = [2.0]
+
+    with gsd.hoomd.open(name=tmp_path / "test_modify_read_frame2.gsd",
+                        mode=open_mode.write) as hf:
+        hf.append(s)
+
+    with gsd.hoomd.open(name=tmp_path / "test_modify_read_frame2.gsd",
+                        mode=open_mode.read) as hf:
+        s = hf[0]
+        assert s.particles.position.dtype == numpy.float32
+        numpy.testing.assert_array_equal(s.particles.position,
+                                         [[7, 8, 9], [10, 11, 12]])
+        numpy.testing.assert_array_equal(s.particles.typeid, [1, 0])
+        numpy.testing.assert_array_equal(s.state['hpmc/sphere/radius'], [2.0])
+
+
+def test_types_utf8(tmp_path, open_mode):
+    """Test that type names with non-ASCII characters round trip."""
+    snap = gsd.hoomd.Snapshot()
+    snap.particles.N = 2
+    snap.particles.types = ['A', 'Ω', 'Na+']
+    snap.bonds.N = 1
+    snap.bonds.types = ['α-β']
+
+    with gsd.hoomd.open(name=tmp_path / "test_types_utf8.gsd",
+                        mode=open_mode.write) as hf:
+        hf.append(snap)
+
+    with gsd.hoomd.open(name=tmp_path / "test_types_utf8.gsd",
+                        mode=open_mode.read) as hf:
+        s = hf[0]
+        assert s.particles.types == ['A', 'Ω', 'Na+']
+        assert s.bonds.types == ['α-β']
+
+
+def test_read_frame_into(tmp_path, open_mode):
+    """Test reading frames into an existing snapshot."""
+    N = 4
+    with gsd.hoomd.open(name=tmp_path / "test_read_frame_into.gsd",
+                        mode=open_mode.write) as hf:
+        for i in range(3):
+            snap = gsd.hoomd.Snapshot()
+            snap.configuration.step = i
+            snap.particles.N = N
+            snap.particles.position = numpy.full((N, 3), i + 1)
+            snap.particles.mass = [2, 3, 4, 5]
+            hf.append(snap)
+
+    with gsd.hoomd.open(name=tmp_path / "test_read_frame_into.gsd",
+                        mode=open_mode.read) as hf:
+        snap = hf[0]
+        position0 = snap.particles.position.copy()
+
+        s = hf.read_frame_into(1, snap)
+        assert s is snap
+        position = snap.particles.position
+        assert snap.configuration.step == 1
+        numpy.testing.assert_array_equal(position, numpy.full((N, 3), 2))
+        numpy.testing.assert_array_equal(snap.particles.mass, [2, 3, 4, 5])
+
+        # the position buffer is reused and frame 0 is not modified
+        hf.read_frame_into(2, snap)
+        assert snap.particles.position is position
+        numpy.testing.assert_array_equal(position, numpy.full((N, 3), 3))
+        numpy.testing.assert_array_equal(hf[0].particles.position, position0)
+
+        hf.read_frame_into(0, snap)
+        assert snap.particles.position is position
+        numpy.testing.assert_array_equal(position, position0)
+        numpy.testing.assert_array_equal(hf[1].particles.position,
+                                         numpy.full((N, 3), 2))
+
+        # negative indices count from the end
+        hf.read_frame_into(-1, snap)
+        assert snap.configuration.step == 2
+        numpy.testing.assert_array_equal(position, numpy.full((N, 3), 3))
+
+        with pytest.raises(IndexError):
+            hf.read_frame_into(3, snap)
+        with pytest.raises(IndexError):
+            hf.read_frame_into(-4, snap)
+
+
+def test_read_frame_into_first(tmp_path, open_mode):
+    """Test reading frame 0 into a snapshot before frame 0 is cached."""
+    with gsd.hoomd.open(name=tmp_path / "test_read_frame_into_first.gsd",
+                        mode=open_mode.write) as hf:
+        for i in range(3):
+            snap = gsd.hoomd.Snapshot()
+            snap.configuration.step = i
+            snap.particles.N = 4
+            if i != 1:
+                snap.particles.mass = [2, 3, 4, 5 + i]
+            hf.append(snap)
+
+    with gsd.hoomd.open(name=tmp_path / "test_read_frame_into_first.gsd",
+                        mode=open_mode.read) as hf:
+        snap = gsd.hoomd.Snapshot()
+        snap.particles.N = 4
+        snap.particles.mass = numpy.zeros(4, dtype=numpy.float32)
+
+        hf.read_frame_into(0, snap)
+        numpy.testing.assert_array_equal(snap.particles.mass, [2, 3, 4, 5])
+        hf.read_frame_into(2, snap)
+        numpy.testing.assert_array_equal(snap.particles.mass, [2, 3, 4, 7])
+
+        # frame 1 falls back to the cached frame 0, which must be unchanged
+        numpy.testing.assert_array_equal(hf[1].particles.mass, [2, 3, 4, 5])
+
+
 def test_iteration(tmp_path, open_mode):
     """Test the iteration protocols for hoomd trajectories."""
     with gsd.hoomd.open(name=tmp_path / "test_iteration.gsd",
@@ -742,6 +1061,18 @@ def test_log(tmp_path, open_mode):
                                          snap1.log['value/pressure'])
 
 
+def test_direct_write_chunk(tmp_path):
+    """Test reading chunks written directly to the file of a trajectory."""
+    with gsd.hoomd.open(name=tmp_path / "test_direct_write_chunk.gsd",
+                        mode='wb+') as hf:
+        hf.file.write_chunk('log/value/foo', numpy.array([1.0]))
+        snap = gsd.hoomd.Snapshot()
+        snap.particles.N = 2
+        hf.append(snap)
+
+        numpy.testing.assert_array_equal(hf[0].log['value/foo'], [1.0])
+
+
 def test_pickle(tmp_path, open_mode):
     """Test that hoomd trajectory objects can be pickled."""
     with gsd.hoomd.open(name=tmp_path / "test_pickling.gsd",